@@ -26,12 +26,23 @@
 # Module import dependencies
 # ===============================
 
-from bluepy.btle import UUID, Peripheral, Scanner, DefaultDelegate
+from bluepy.btle import (
+    UUID,
+    BTLEDisconnectError,
+    BTLEException,
+    DefaultDelegate,
+    Peripheral,
+    Scanner,
+)
+import os
+import socket
+import stat
 import sys
 import time
 import struct
-import tableprint
 import argparse
+from bisect import bisect_right
+from collections import namedtuple
 
 # ===============================
 # Global variables
@@ -55,150 +66,155 @@ VARIABLES = [
     "co2",
     "voc",
 ]
-
-TABLEPRINT_WIDTH = 12
+UNITS = ("%rH", "Bq/m3", "Bq/m3", "degC", "hPa", "ppm", "ppb")
+
+TABLE_WIDTH = 12
+TABLE_ROW_FORMAT = (
+    "│ " + " │ ".join([f"{{:>{TABLE_WIDTH}}}"] * NUMBER_OF_SENSORS) + " │"
+)
+TABLE_TOP_BORDER = (
+    "╭─" + "─┬─".join(["─" * TABLE_WIDTH] * NUMBER_OF_SENSORS) + "─╮"
+)
+TABLE_HEADER_BORDER = (
+    "├─" + "─┼─".join(["─" * TABLE_WIDTH] * NUMBER_OF_SENSORS) + "─┤"
+)
+PIPE_FORMAT = ",".join(["%s"] * NUMBER_OF_SENSORS) + "\n"
 WAVEPLUS_UUID = "b42e2a68-ade7-11e4-89d3-123b93f75cba"
 SCAN_TIMEOUT = 0.1
 MAX_SEARCH_COUNT = 50
 VALID_SENSOR_VERSION = 1
+MAX_RADON = 16383
+DAEMON_CLIENT_TIMEOUT = 5
+MAC_ADDR_CACHE_DIR = os.path.expanduser("~/.cache/waveplus")
+# Current values: sensor version, humidity, two reserved bytes, radon
+# short/long term averages, temperature, pressure, CO2, VOC and four
+# reserved bytes. Reserved fields are skipped as padding so that they are
+# not unpacked into objects on every read.
+SENSOR_STRUCT = struct.Struct("<BB2xHHHHHH4x")
+AIRTHINGS_COMPANY_ID = 0x0334
+# Manufacturer data: 2-byte company ID followed by the 4-byte serial number
+SERIAL_NUMBER_STRUCT = struct.Struct("<HI")
+
+# Status of a reading is STATUSES[i], where i is the number of thresholds
+# that are less than or equal to the value
+HUMIDITY_THRESHOLDS = (25, 30, 60, 70)
+HUMIDITY_STATUSES = ("red", "yellow", "green", "yellow", "red")
+RADON_THRESHOLDS = (100, 150)
+RADON_STATUSES = ("green", "yellow", "red")
+TEMPERATURE_THRESHOLDS = (18, 25)
+TEMPERATURE_STATUSES = ("blue", "green", "red")
+CO2_THRESHOLDS = (800, 1000)
+CO2_STATUSES = ("green", "yellow", "red")
+VOC_THRESHOLDS = (250, 2000)
+VOC_STATUSES = ("green", "yellow", "red")
+
+# Variables whose status contributes to the overall statusbar status, which
+# is the worst of them according to STATUS_RANK
+OVERALL_STATUS_VARIABLES = ("humidity", "radon_sta", "radon_lta", "co2", "voc")
+OVERALL_STATUSES = ("green", "yellow", "red")
+STATUS_RANK = {"N/A": 0, "green": 0, "blue": 0, "yellow": 1, "red": 2}
+ALERT_STATUSES = frozenset({"blue", "yellow", "red"})
 
 # ====================================
-# Variable classes
+# Sensor readings
 # ====================================
 
 
-class Humidity(float):
-    def __new__(cls, value):
-        return super(Humidity, cls).__new__(cls, value)
-
-    def __init__(self, value):
-        self.value = value
-        self.unit = "%rH"
-        self.status = self.status()
+class Reading(namedtuple("Reading", ["value", "unit"])):
+    __slots__ = ()
 
     def __str__(self):
-        return f"{super().__str__()} {self.unit}"
-
-    def status(self):
-        if self < 25 or self >= 70:
-            return "red"
-        if 60 <= self < 70 or 25 <= self < 30:
-            return "yellow"
-        return "green"
+        return f"{self.value} {self.unit}"
 
 
-class Radon(int):
-    def __new__(cls, value):
-        return super(Radon, cls).__new__(cls, value)
-
-    def __init__(self, value):
-        self.value = value
-        self.unit = "Bq/m3"
-        self.status = self.status()
-
-    def __str__(self):
-        return f"{super().__str__()} {self.unit}"
+def humidity_status(humidity):
+    return HUMIDITY_STATUSES[bisect_right(HUMIDITY_THRESHOLDS, humidity)]
 
-    def status(self):
-        if self >= 150:
-            return "red"
-        if self >= 100:
-            return "yellow"
-        return "green"
 
+def radon_status(radon):
+    if radon == "N/A":
+        return "N/A"
+    return RADON_STATUSES[bisect_right(RADON_THRESHOLDS, radon)]
 
-class Temperature(float):
-    def __new__(cls, value):
-        return super(Temperature, cls).__new__(cls, value)
 
-    def __init__(self, value):
-        self.value = value
-        self.unit = "degC"
-        self.status = self.status()
+def temperature_status(temperature):
+    return TEMPERATURE_STATUSES[
+        bisect_right(TEMPERATURE_THRESHOLDS, temperature)
+    ]
 
-    def __str__(self):
-        return f"{super().__str__()} {self.unit}"
 
-    def status(self):
-        if self >= 25:
-            return "red"
-        if self < 18:
-            return "blue"
-        return "green"
+def co2_status(co2):
+    return CO2_STATUSES[bisect_right(CO2_THRESHOLDS, co2)]
 
 
-class Pressure(int):
-    def __new__(cls, value):
-        return super(Pressure, cls).__new__(cls, value)
+def voc_status(voc):
+    return VOC_STATUSES[bisect_right(VOC_THRESHOLDS, voc)]
 
-    def __init__(self, value):
-        self.value = value
-        self.unit = "hPa"
-        self.status = "N/A"
 
-    def __str__(self):
-        return f"{super().__str__()} {self.unit}"
+# Variables without a status function (pressure) have status "N/A"
+STATUS_FUNCTIONS = {
+    "humidity": humidity_status,
+    "radon_sta": radon_status,
+    "radon_lta": radon_status,
+    "temperature": temperature_status,
+    "co2": co2_status,
+    "voc": voc_status,
+}
 
 
-class CO2(int):
-    def __new__(cls, value):
-        return super(CO2, cls).__new__(cls, value)
+def reading_status(variable, reading):
+    # Computed on demand, since only the statusbar output needs it
+    status_function = STATUS_FUNCTIONS.get(variable)
+    if status_function is None:
+        return "N/A"
+    return status_function(reading.value)
 
-    def __init__(self, value):
-        self.value = value
-        self.unit = "ppm"
-        self.status = self.status()
 
-    def __str__(self):
-        return f"{super().__str__()} {self.unit}"
+# ====================================
+# Utility functions for WavePlus class
+# ====================================
 
-    def status(self):
-        if self >= 1000:
-            return "red"
-        if self >= 800:
-            return "yellow"
-        return "green"
 
+def parse_serial_number(manu_data_hex_str):
+    if manu_data_hex_str is None or manu_data_hex_str == "None":
+        return "Unknown"
+    manu_data = bytes.fromhex(manu_data_hex_str)
+    if len(manu_data) < SERIAL_NUMBER_STRUCT.size:
+        return "Unknown"
+    company_id, sn = SERIAL_NUMBER_STRUCT.unpack_from(manu_data)
+    if company_id != AIRTHINGS_COMPANY_ID:
+        return "Unknown"
+    return sn
 
-class VOC(int):
-    def __new__(cls, value):
-        return super(VOC, cls).__new__(cls, value)
 
-    def __init__(self, value):
-        self.value = value
-        self.unit = "ppb"
-        self.status = self.status()
+def mac_addr_cache_path(serial_number):
+    return os.path.join(MAC_ADDR_CACHE_DIR, f"{serial_number}.mac")
 
-    def __str__(self):
-        return f"{super().__str__()} {self.unit}"
 
-    def status(self):
-        if self >= 2000:
-            return "red"
-        if self >= 250:
-            return "yellow"
-        return "green"
+def read_cached_mac_addr(serial_number):
+    try:
+        with open(mac_addr_cache_path(serial_number)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
 
 
-# ====================================
-# Utility functions for WavePlus class
-# ====================================
+def write_cached_mac_addr(serial_number, mac_addr):
+    # The cache only saves a scan on the next run, so failing to write it
+    # is not an error
+    try:
+        os.makedirs(MAC_ADDR_CACHE_DIR, exist_ok=True)
+        with open(mac_addr_cache_path(serial_number), "w") as f:
+            f.write(mac_addr + "\n")
+    except OSError:
+        pass
 
 
-def parse_serial_number(manu_data_hex_str):
-    if manu_data_hex_str is None or manu_data_hex_str == "None":
-        sn = "Unknown"
-    else:
-        manu_data = bytearray.fromhex(manu_data_hex_str)
-
-        if ((manu_data[1] << 8) | manu_data[0]) == 0x0334:
-            sn = manu_data[2]
-            sn |= manu_data[3] << 8
-            sn |= manu_data[4] << 16
-            sn |= manu_data[5] << 24
-        else:
-            sn = "Unknown"
-    return sn
+def remove_cached_mac_addr(serial_number):
+    try:
+        os.remove(mac_addr_cache_path(serial_number))
+    except OSError:
+        pass
 
 
 # ===============================
@@ -206,26 +222,51 @@ def parse_serial_number(manu_data_hex_str):
 # ===============================
 
 
+class SearchDelegate(DefaultDelegate):
+    # Only parses advertisements that are new since the last callback,
+    # instead of every device seen so far on each poll of the scanner
+    def __init__(self, serial_number):
+        super().__init__()
+        self.sn = serial_number
+        self.mac_addr = None
+
+    def handleDiscovery(self, dev, isNewDev, isNewData):
+        if self.mac_addr is not None or not (isNewDev or isNewData):
+            return
+        manu_data = dev.getValueText(255)
+        if parse_serial_number(manu_data) == self.sn:
+            self.mac_addr = dev.addr
+
+
 class WavePlus:
-    def __init__(self, serial_number, mac_addr):
+    def __init__(self, serial_number, mac_addr, force_rescan=False):
         self.periph = None
         self.curr_val_char = None
+        self.handle = None
+        self.version_checked = False
         self.mac_addr = mac_addr
         self.sn = serial_number
+        self.force_rescan = force_rescan
+        self.mac_addr_from_cache = False
         self.uuid = UUID(WAVEPLUS_UUID)
+        self.sensors = Sensors()
 
     def search(self):
         # Auto-discover device on first connection
-        scanner = Scanner().withDelegate(DefaultDelegate())
-        search_count = 0
-        while search_count < MAX_SEARCH_COUNT:
-            devices = scanner.scan(SCAN_TIMEOUT)
-            search_count += 1
-            for dev in devices:
-                manu_data = dev.getValueText(255)
-                sn = parse_serial_number(manu_data)
-                if sn == self.sn:
-                    return dev.addr
+        # Keep one scan running for the whole search rather than restarting
+        # it every SCAN_TIMEOUT, so no advertisements are missed in between
+        delegate = SearchDelegate(self.sn)
+        scanner = Scanner().withDelegate(delegate)
+        scanner.start()
+        try:
+            search_count = 0
+            while search_count < MAX_SEARCH_COUNT:
+                scanner.process(SCAN_TIMEOUT)
+                search_count += 1
+                if delegate.mac_addr is not None:
+                    return delegate.mac_addr
+        finally:
+            scanner.stop()
 
         # Device not found after MAX_SEARCH_COUNT
         print(
@@ -238,30 +279,70 @@ class WavePlus:
         sys.exit(1)
 
     def connect(self):
+        if self.mac_addr is None and not self.force_rescan:
+            self.mac_addr = read_cached_mac_addr(self.sn)
+            self.mac_addr_from_cache = self.mac_addr is not None
         if self.mac_addr is None:
             self.mac_addr = self.search()
+            write_cached_mac_addr(self.sn, self.mac_addr)
         if self.periph is None:
-            self.periph = Peripheral(self.mac_addr)
+            try:
+                self.periph = Peripheral(self.mac_addr)
+            except (BTLEException, ValueError):
+                if not self.mac_addr_from_cache:
+                    raise
+                # The cached address may be stale or corrupt, so fall back to
+                # searching for the device once
+                remove_cached_mac_addr(self.sn)
+                self.mac_addr = self.search()
+                write_cached_mac_addr(self.sn, self.mac_addr)
+                self.periph = Peripheral(self.mac_addr)
+            finally:
+                self.mac_addr_from_cache = False
         if self.curr_val_char is None:
             self.curr_val_char = self.periph.getCharacteristics(
                 uuid=self.uuid
             )[0]
+            self.handle = self.curr_val_char.getHandle()
+
+    def reconnect_if_needed(self):
+        # The link is kept open between samples, so it may have been dropped
+        # by the device in the meantime; only then is it rebuilt
+        try:
+            return self.periph.readCharacteristic(self.handle)
+        except BTLEDisconnectError:
+            self.disconnect()
+            self.connect()
+            return self.periph.readCharacteristic(self.handle)
 
     def read(self):
         if self.curr_val_char is None:
             print("ERROR: Devices are not connected.")
             sys.exit(1)
-        raw_data = self.curr_val_char.read()
-        raw_data = struct.unpack("<BBBBHHHHHHHH", raw_data)
-        sensors = Sensors()
-        sensors.set(raw_data)
-        return sensors
+        raw_data = self.reconnect_if_needed()
+        # The firmware does not change while connected, so the sensor
+        # version is only checked on the first read of each connection
+        if not self.version_checked:
+            if raw_data[0] != VALID_SENSOR_VERSION:
+                print(
+                    "ERROR: Unknown sensor version.",
+                    "GUIDE: Contact Airthings for support.",
+                    sep="\n",
+                )
+                sys.exit(1)
+            self.version_checked = True
+        raw_data = SENSOR_STRUCT.unpack_from(raw_data)
+        self.sensors.set(raw_data)
+        return self.sensors
 
     def disconnect(self):
         if self.periph is not None:
-            self.periph.disconnect()
-            self.periph = None
-            self.curr_val_char = None
+            try:
+                self.periph.disconnect()
+            finally:
+                self.periph = None
+                self.curr_val_char = None
+                self.version_checked = False
 
 
 # ===================================
@@ -270,54 +351,57 @@ class WavePlus:
 
 
 class Sensors:
+    __slots__ = ("sensor_version", "values")
+
     def __init__(self):
         self.sensor_version = None
-        self.sensor_data = {}
+        self.values = None
 
     def set(self, raw_data):
         self.sensor_version = raw_data[0]
-        if self.sensor_version != VALID_SENSOR_VERSION:
-            print(
-                "ERROR: Unknown sensor version.",
-                "GUIDE: Contact Airthings for support.",
-                sep="\n",
-            )
-            sys.exit(1)
-        self.sensor_data["humidity"] = Humidity(raw_data[1] / 2.0)
-        self.sensor_data["radon_sta"] = Radon(self.conv2radon(raw_data[4]))
-        self.sensor_data["radon_lta"] = Radon(self.conv2radon(raw_data[5]))
-        self.sensor_data["temperature"] = Temperature(raw_data[6] / 100.0)
-        self.sensor_data["pressure"] = Pressure(raw_data[7] / 50.0)
-        self.sensor_data["co2"] = CO2(raw_data[8] * 1.0)
-        self.sensor_data["voc"] = VOC(raw_data[9] * 1.0)
-
-    def conv2radon(self, radon_raw):
-        radon = "N/A"  # Either invalid measurement, or not available
-        if 0 <= radon_raw <= 16383:
-            radon = radon_raw
-        return radon
+        humidity = raw_data[1] / 2.0
+        # Radon values above MAX_RADON are invalid or not yet available. The
+        # raw values are unsigned, so there is no lower bound to check.
+        radon_sta = raw_data[2] if raw_data[2] <= MAX_RADON else "N/A"
+        radon_lta = raw_data[3] if raw_data[3] <= MAX_RADON else "N/A"
+        temperature = raw_data[4] / 100.0
+        pressure = int(raw_data[5] / 50.0)
+        co2 = raw_data[6]
+        voc = raw_data[7]
+        # In VARIABLES order; readings and formatted strings are only built
+        # by the output mode that needs them
+        self.values = (
+            humidity,
+            radon_sta,
+            radon_lta,
+            temperature,
+            pressure,
+            co2,
+            voc,
+        )
+
+    @property
+    def formatted(self):
+        return tuple(
+            f"{value} {unit}" for value, unit in zip(self.values, UNITS)
+        )
 
     def get_variable(self, variable):
-        return self.sensor_data[variable]
+        idx = VARIABLES.index(variable)
+        return Reading(self.values[idx], UNITS[idx])
+
+
+def statusbar_line(data):
+    status = {var: reading_status(var, data[var]) for var in data}
+    worst = max(STATUS_RANK[status[var]] for var in OVERALL_STATUS_VARIABLES)
+    overall_status = OVERALL_STATUSES[worst]
+    print_vars = [data[var] for var in data if status[var] in ALERT_STATUSES]
+    emoji = overall_status_emoji(overall_status)
+    return emoji + " ".join(map(str, print_vars))
 
 
 def statusbar_print(data):
-    overall_status = "green"
-    status = [
-        data[var].status
-        for var in data
-        if var in {"humidity", "co2", "voc", "radon"}
-    ]
-    print_vars = []
-    if "red" in status:
-        overall_status = "red"
-    elif "yellow" in status:
-        overall_status = "yellow"
-    for var in data:
-        if data[var].status in {"blue", "yellow", "red"}:
-            print_vars.append(data[var])
-    print(overall_status_emoji(overall_status), end="")
-    print(*print_vars, sep=" ")
+    print(statusbar_line(data))
 
 
 def overall_status_emoji(status):
@@ -329,11 +413,94 @@ def overall_status_emoji(status):
         return "🔴"
 
 
+def serve_statusbar(waveplus, socket_path):
+    # Keep the BLE link open and answer each connection on the socket with
+    # a fresh statusbar line, so that clients do not scan and connect
+    try:
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            print(f"ERROR: {socket_path} exists and is not a socket.")
+            sys.exit(1)
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    except OSError as err:
+        print(f"ERROR: Could not use {socket_path}: {err.strerror}.")
+        sys.exit(1)
+    # Search for the device up front, so that later reconnects reuse its
+    # MAC address and never reach the sys.exit in search()
+    waveplus.connect()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        try:
+            server.bind(socket_path)
+        except OSError as err:
+            print(f"ERROR: Could not use {socket_path}: {err.strerror}.")
+            sys.exit(1)
+        server.listen()
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        conn.settimeout(DAEMON_CLIENT_TIMEOUT)
+                        conn.recv(1)
+                        line = read_statusbar_line(waveplus)
+                        conn.sendall((line + "\n").encode())
+                    except OSError:
+                        # The client hung up or stalled; serve the next one
+                        pass
+        finally:
+            os.unlink(socket_path)
+
+
+def read_statusbar_line(waveplus):
+    try:
+        waveplus.connect()
+        sensors = waveplus.read()
+    except (BTLEException, OSError):
+        # Drop the link so that the next request reconnects
+        try:
+            waveplus.disconnect()
+        except (BTLEException, OSError):
+            pass
+        return "ERROR: Could not read from device."
+    data = {var: sensors.get_variable(var) for var in VARIABLES}
+    return statusbar_line(data)
+
+
+def request_statusbar(socket_path):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(b"\n")
+            client.shutdown(socket.SHUT_WR)
+            response = b""
+            while True:
+                chunk = client.recv(1024)
+                if not chunk:
+                    break
+                response += chunk
+    except OSError:
+        print(
+            "ERROR: Could not connect to daemon.",
+            "GUIDE: Start it with --daemon --socket SOCKET.",
+            sep="\n",
+        )
+        sys.exit(1)
+    response = response.decode()
+    if not response:
+        response = "ERROR: Empty reply from daemon.\n"
+    sys.stdout.write(response)
+    # The daemon reports device errors as an ERROR line
+    if response.startswith("ERROR:"):
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "serial_number",
         type=int,
+        nargs="?",
         help="the 10-digit serial number found under the magnetic backplate of your Wave Plus",
     )
     parser.add_argument(
@@ -354,8 +521,52 @@ def main():
         "--mac-addr",
         help="the MAC address of the Wave Plus device",
     )
+    parser.add_argument(
+        "--force-rescan",
+        action="store_true",
+        help="ignore the cached MAC address and scan for the device",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep the device connected and serve statusbar lines on --socket",
+    )
+    parser.add_argument(
+        "--socket",
+        help="the Unix socket of the daemon. Use --statusbar --socket SOCKET, "
+        "without a serial number, to query a running daemon",
+    )
     args = parser.parse_args()
 
+    if args.socket is not None and not (args.daemon or args.statusbar):
+        print("ERROR: --socket requires --daemon or --statusbar.")
+        parser.print_usage()
+        sys.exit(1)
+
+    if args.force_rescan and args.mac_addr is not None:
+        print("ERROR: --force-rescan cannot be combined with --mac-addr.")
+        parser.print_usage()
+        sys.exit(1)
+
+    if args.daemon and args.socket is None:
+        print("ERROR: --daemon requires --socket.")
+        parser.print_usage()
+        sys.exit(1)
+
+    if args.daemon and (args.pipe or args.statusbar):
+        print("ERROR: --daemon cannot be combined with --pipe or --statusbar.")
+        parser.print_usage()
+        sys.exit(1)
+
+    if args.statusbar and args.socket is not None:
+        request_statusbar(args.socket)
+        return
+
+    if args.serial_number is None:
+        print("ERROR: Missing SN.")
+        parser.print_usage()
+        sys.exit(1)
+
     if len(str(args.serial_number)) != 10:
         print("ERROR: Invalid SN format.")
         parser.print_usage()
@@ -366,43 +577,46 @@ def main():
         parser.print_usage()
         sys.exit(1)
 
+    header = [
+        "Humidity",
+        "Radon ST avg",
+        "Radon LT avg",
+        "Temperature",
+        "Pressure",
+        "CO2 level",
+        "VOC level",
+    ]
+
+    if args.pipe:
+        sys.stdout.write(PIPE_FORMAT % tuple(header))
+    elif not (args.statusbar or args.daemon):
+        print(
+            TABLE_TOP_BORDER,
+            TABLE_ROW_FORMAT.format(*header),
+            TABLE_HEADER_BORDER,
+            sep="\n",
+        )
+
+    waveplus = WavePlus(args.serial_number, args.mac_addr, args.force_rescan)
+
     try:
-        waveplus = WavePlus(args.serial_number, args.mac_addr)
-
-        header = [
-            "Humidity",
-            "Radon ST avg",
-            "Radon LT avg",
-            "Temperature",
-            "Pressure",
-            "CO2 level",
-            "VOC level",
-        ]
-
-        if args.pipe:
-            print(*header, sep=",")
-        elif not args.statusbar:
-            print(tableprint.header(header, width=TABLEPRINT_WIDTH))
+        if args.daemon:
+            serve_statusbar(waveplus, args.socket)
+            return
 
         while True:
             waveplus.connect()
             sensors = waveplus.read()
 
-            data = {var: sensors.get_variable(var) for var in VARIABLES}
             if args.statusbar:
+                data = {var: sensors.get_variable(var) for var in VARIABLES}
                 statusbar_print(data)
-                sys.exit(0)
+                return
 
             if args.pipe:
-                print(*data.values(), sep=",")
+                sys.stdout.write(PIPE_FORMAT % sensors.formatted)
             else:
-                print(
-                    tableprint.row(
-                        list(map(str, data.values())), width=TABLEPRINT_WIDTH
-                    )
-                )
-
-            waveplus.disconnect()
+                print(TABLE_ROW_FORMAT.format(*sensors.formatted))
 
             time.sleep(args.sample_period)
 